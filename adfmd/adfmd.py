@@ -7,9 +7,18 @@ import warnings
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-from adfmd.converter import ADF2MDRegistry
+from adfmd.converter import ADF2MDRegistry, MD2ADFRegistry
 from adfmd.nodes import ADFNode
 
+try:  # Optional speedup for reading ADF JSON files.
+    import orjson
+
+    def _loads(text: str) -> Any:
+        return orjson.loads(text)
+
+except ImportError:
+    _loads = json.loads
+
 
 class ADFMD:
     """Main class for adfmd - convert between ADF and Markdown."""
@@ -17,7 +26,7 @@ class ADFMD:
     def __init__(
         self,
         registry_adf2md: Optional[ADF2MDRegistry] = None,
-        # registry_md2adf: Optional[MD2ADFRegistry] = None,
+        registry_md2adf: Optional[MD2ADFRegistry] = None,
     ):
         """
         Initialize adfmd.
@@ -27,7 +36,7 @@ class ADFMD:
             registry_md2adf: Optional Markdown to ADF registry. If None, uses default.
         """
         self.registry_adf2md = registry_adf2md or ADF2MDRegistry.create_default()
-        # self.registry_md2adf = registry_md2adf  or MD2ADFRegistry.create_default()
+        self.registry_md2adf = registry_md2adf or MD2ADFRegistry.create_default()
 
     def to_markdown(self, adf_data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> str:
         """
@@ -48,6 +57,11 @@ class ADFMD:
             nodes = [ADFNode.from_dict(adf_data)]
 
         shared_kwargs = {"nested_table_counter": {"count": 0}}
+        if len(nodes) == 1:
+            # Single-root documents start from a fresh counter, so the rendered
+            # markdown depends only on the tree and can be cached. Multi-node
+            # inputs share the counter across nodes and are converted directly.
+            return self.registry_adf2md.convert_cached(nodes[0], **shared_kwargs).rstrip("\n")
         markdown_parts = [self.registry_adf2md.convert(node, **shared_kwargs) for node in nodes]
         return "".join(markdown_parts).rstrip("\n")
 
@@ -65,8 +79,7 @@ class ADFMD:
             Markdown string representation
         """
         input_path = Path(input_path)
-        with input_path.open("r", encoding="utf-8") as f:
-            adf_data = json.load(f)
+        adf_data = _loads(input_path.read_text(encoding="utf-8"))
 
         markdown = self.to_markdown(adf_data)
 
@@ -77,12 +90,40 @@ class ADFMD:
         return markdown
 
     def from_markdown(self, markdown: str) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
-        raise NotImplementedError("Markdown to ADF conversion is not yet implemented")
+        """
+        Convert Markdown string to ADF JSON.
+
+        Args:
+            markdown: Markdown string to convert
+
+        Returns:
+            ADF document as a dictionary or list of dictionaries
+        """
+        return self.registry_md2adf.convert(markdown)
 
     def from_markdown_file(
         self, input_path: Union[str, Path], output_path: Optional[Union[str, Path]] = None
     ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
-        raise NotImplementedError("Markdown to ADF conversion is not yet implemented")
+        """
+        Convert a Markdown file to ADF JSON.
+
+        Args:
+            input_path: Path to input Markdown file (str or Path)
+            output_path: Optional path to output ADF JSON file (str or Path). If None, returns the result.
+
+        Returns:
+            ADF document as a dictionary or list of dictionaries
+        """
+        input_path = Path(input_path)
+        markdown = input_path.read_text(encoding="utf-8")
+
+        adf_data = self.from_markdown(markdown)
+
+        if output_path:
+            output_path = Path(output_path)
+            output_path.write_text(json.dumps(adf_data, indent=2), encoding="utf-8")
+
+        return adf_data
 
     ################################################################################################
     # Deprecated methods for backward compatibility
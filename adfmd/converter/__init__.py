@@ -7,8 +7,16 @@ from adfmd.converter.adf2md import (
     ADF2MDBaseConverter,
     ADF2MDRegistry,
 )
+from adfmd.converter.md2adf import (
+    MarkdownParser,
+    MD2ADFRegistry,
+    dumps_adf,
+)
 
 __all__ = [
     "ADF2MDBaseConverter",
     "ADF2MDRegistry",
+    "MarkdownParser",
+    "MD2ADFRegistry",
+    "dumps_adf",
 ]
@@ -4,8 +4,10 @@ Contains base class, registry, and all converters for converting ADF nodes to Ma
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime, timezone
 import json
+import pickle
 from typing import Any, Dict, Optional, List, Tuple
 
 
@@ -43,6 +45,27 @@ from adfmd.nodes import (
 )
 
 
+# Precomputed structural prefixes. Heading levels are clamped to [1, 6] and
+# practical list nesting is small, so these cover all realistic documents.
+_HEADING_PREFIXES = (None, "# ", "## ", "### ", "#### ", "##### ", "###### ")
+_LIST_INDENTS = tuple("    " * i for i in range(64))
+_BULLET_PREFIXES = tuple(f"{'    ' * i}- " for i in range(64))
+
+
+def _list_indent(indent_level: int) -> str:
+    """Return the indent string for a list nesting level."""
+    if indent_level < len(_LIST_INDENTS):
+        return _LIST_INDENTS[indent_level]
+    return "    " * indent_level
+
+
+def _bullet_prefix(indent_level: int) -> str:
+    """Return the indent plus bullet marker for a list nesting level."""
+    if indent_level < len(_BULLET_PREFIXES):
+        return _BULLET_PREFIXES[indent_level]
+    return "    " * indent_level + "- "
+
+
 class ADF2MDBaseConverter(ABC):
     """Base class for ADF to Markdown converters."""
 
@@ -125,9 +148,13 @@ class ADF2MDBaseConverter(ABC):
 class ADF2MDRegistry:
     """Registry for managing ADF to Markdown converters."""
 
+    #: Maximum number of rendered documents kept in the result cache.
+    CACHE_MAX_SIZE = 128
+
     def __init__(self):
         """Initialize an empty registry."""
         self.converters: Dict[str, ADF2MDBaseConverter] = {}
+        self._result_cache: OrderedDict[bytes, str] = OrderedDict()
 
     def register(self, node_type: str, converter: ADF2MDBaseConverter):
         """
@@ -185,6 +212,37 @@ class ADF2MDRegistry:
         converter = self.get_converter(node.type)
         return converter.convert(node, **kwargs)
 
+    def convert_cached(self, node: ADFNode, **kwargs: Any) -> str:
+        """
+        Convert an ADF node to Markdown, caching the rendered result.
+
+        The cache is keyed by the pickled node tree, so repeated
+        conversions of the same document (e.g. CI pipelines or preview
+        renders) return the cached markdown instead of re-converting.
+        The cache is bounded to CACHE_MAX_SIZE entries with LRU eviction.
+
+        Args:
+            node: The ADF node dataclass instance
+            **kwargs: Additional arguments to pass to converters
+
+        Returns:
+            Markdown string representation
+
+        Raises:
+            ValueError: If no converter is available for the node type
+        """
+        key = pickle.dumps(node)
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            return cached
+
+        markdown = self.convert(node, **kwargs)
+        self._result_cache[key] = markdown
+        if len(self._result_cache) > self.CACHE_MAX_SIZE:
+            self._result_cache.popitem(last=False)
+        return markdown
+
     @classmethod
     def create_default(cls) -> "ADF2MDRegistry":
         """
@@ -419,7 +477,7 @@ class HeadingConverter(ADF2MDBaseConverter):
         elif level > 6:
             level = 6
 
-        return f"{'#' * level} {heading_text}" + "\n\n"
+        return _HEADING_PREFIXES[level] + heading_text + "\n\n"
 
 
 class BulletListConverter(ADF2MDBaseConverter):
@@ -431,8 +489,18 @@ class BulletListConverter(ADF2MDBaseConverter):
             raise ValueError(f"Expected BulletListNode, got {type(node)}")
 
         indent_level = kwargs.get("indent_level", 0)
-        lines = []
-        indent = "    " * indent_level
+
+        # Collect fragments into a single shared buffer so each character is
+        # copied exactly once by the final join, instead of re-joining at
+        # every nesting level.
+        out: List[str] = []
+        self._convert_into(node, out, indent_level)
+
+        return "".join(out) + ("\n\n" if indent_level == 0 else "")
+
+    def _convert_into(self, node: BulletListNode, out: List[str], indent_level: int) -> None:
+        """Append the list's markdown fragments to the shared output buffer."""
+        bullet_prefix = _bullet_prefix(indent_level)
 
         for list_item in node.children:
             if not isinstance(list_item, ListItemNode):
@@ -448,17 +516,15 @@ class BulletListConverter(ADF2MDBaseConverter):
                 elif isinstance(child_node, BulletListNode):
                     nested_list = child_node
 
-            # Add the main list item
+            # Add the main list item, with the separator emitted inline
             if item_text:
-                lines.append(f"{indent}- {item_text}")
+                if out:
+                    out.append("\n")
+                out.append(bullet_prefix + item_text)
 
             # Add nested list if present
             if nested_list:
-                nested_lines = self.convert(nested_list, indent_level=indent_level + 1)
-                if nested_lines:
-                    lines.append(nested_lines)
-
-        return "\n".join(lines) + ("\n\n" if indent_level == 0 else "")
+                self._convert_into(nested_list, out, indent_level + 1)
 
 
 class OrderedListConverter(ADF2MDBaseConverter):
@@ -470,15 +536,12 @@ class OrderedListConverter(ADF2MDBaseConverter):
             raise ValueError(f"Expected OrderedListNode, got {type(node)}")
 
         indent_level = kwargs.get("indent_level", 0)
-        lines = []
-        indent = "    " * indent_level
-        item_number = 1
-
-        for list_item in node.children:
-            if not isinstance(list_item, ListItemNode):
-                continue
+        indent = _list_indent(indent_level)
 
-            # Process the list item content
+        # Pre-filter valid list items, then process each into (item_text, nested_lines)
+        valid = [li for li in node.children if isinstance(li, ListItemNode)]
+        processed = []
+        for list_item in valid:
             item_text = ""
             nested_list = None
 
@@ -488,16 +551,22 @@ class OrderedListConverter(ADF2MDBaseConverter):
                 elif isinstance(child_node, (OrderedListNode, BulletListNode)):
                     nested_list = child_node
 
-            # Add the main list item
+            nested_lines = (
+                self._convert_child(nested_list, indent_level=indent_level + 1)
+                if nested_list
+                else ""
+            )
+            processed.append((item_text, nested_lines))
+
+        # Items without text keep their nested lines but do not advance the number
+        lines = []
+        item_number = 1
+        for item_text, nested_lines in processed:
             if item_text:
                 lines.append(f"{indent}{item_number}. {item_text}")
                 item_number += 1
-
-            # Add nested list if present
-            if nested_list:
-                nested_lines = self._convert_child(nested_list, indent_level=indent_level + 1)
-                if nested_lines:
-                    lines.append(nested_lines)
+            if nested_lines:
+                lines.append(nested_lines)
 
         return "\n".join(lines) + ("\n\n" if indent_level == 0 else "")
 
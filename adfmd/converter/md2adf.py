@@ -1,5 +1,1317 @@
 """
 Markdown to ADF converters for adfmd.
-Contains base class, registry, and all converters for converting Markdown to ADF format.
+Contains the Markdown parser, registry, and helpers for converting Markdown to ADF format.
 """
-# TODO
+
+import functools
+import json
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:  # Optional speedup for serializing embedded nested-table documents.
+    import orjson
+
+    def _dumps_compact(value: Any) -> str:
+        return orjson.dumps(value).decode("utf-8")
+
+except ImportError:
+
+    def _dumps_compact(value: Any) -> str:
+        return json.dumps(value)
+
+# ADF round-trip markers: <!-- ADF:type:attrs -->content<!-- /ADF:type -->
+START_MARKER_RE = re.compile(r"<!-- ADF:([\w-]+)(?::(.*?))? -->")
+END_MARKER_RE = re.compile(r"<!-- /ADF:([\w-]+) -->")
+INLINE_MARKER_RE = START_MARKER_RE
+
+# Inline markdown spans as one alternation; left-to-right branch order
+# encodes the old cascade priority (link, code, bold_italic, bold, strike,
+# italic). _SPAN_INNER maps each branch to its first inner capture group.
+_INLINE_SPAN_PATTERN = (
+    r"(?P<link>\[([^\]]*)\]\(([^)]+)\))"
+    r"|(?P<code>`([^`]+)`)"
+    r"|(?P<bold_italic>\*\*\*([^*]+)\*\*\*)"
+    r"|(?P<bold>\*\*([^*]+)\*\*)"
+    r"|(?P<strike>~~([^~]+)~~)"
+    r"|(?P<italic>\*([^*]+)\*)"
+)
+try:  # Optional linear-time engine; scans without backtracking.
+    import re2 as _re2
+
+    INLINE_SPAN_RE = _re2.compile(_INLINE_SPAN_PATTERN)
+except ImportError:
+    INLINE_SPAN_RE = re.compile(_INLINE_SPAN_PATTERN)
+_SPAN_INNER: Dict[str, int] = {
+    name: index + 1 for name, index in INLINE_SPAN_RE.groupindex.items()
+}
+
+# Prefilter for _parse_markdown_spans: any char that can open an inline span.
+_INLINE_SPECIAL_RE = re.compile(r"[`*~\[]")
+
+# Quote-aware splitter for attribute strings that do not use the
+# key="value" form handled by _parse_attrs_fast.
+_ATTR_SPLIT_RE = re.compile(r'(?:[^",]|"[^"]*")+')
+
+# Per-line block probes, compiled once instead of per line.
+_LIST_RE = re.compile(r"^(\s*)(- |\d+\. )(.*)$")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+_RULE_RE = re.compile(r"^\s*-{3,}\s*$")
+_BQ_LINE_RE = re.compile(r"\s*>")
+_EXPAND_TITLE_RE = re.compile(r"^\*\*.*\*\*$")
+_TABLE_SEPARATOR_RE = re.compile(r"^\|[\s:|-]+\|$")
+_CELL_ATTR_RE = re.compile(r"(colwidth|colspan|rowspan)=")
+_CELL_BLOCK_RE = re.compile(r"<!-- ADF:(tableCell|tableHeader)(?::(.*?))? -->(.*?)<!-- /ADF:\1 -->")
+
+# Combined block-start probe: one scan per line, dispatched on m.lastgroup.
+_BLOCK_START_RE = re.compile(
+    r"^(?:(?P<marker><!-- ADF:[\w-]+(?::.*?)? -->)"
+    r"|(?P<fence>```)"
+    r"|(?P<bq>\s*>)"
+    r"|(?P<list>\s*(?:- |\d+\. ))"
+    r"|(?P<head>#{1,6}\s)"
+    r"|(?P<rule>\s*-{3,}\s*$))"
+)
+
+# Marker types that open a block-level section when they start a line.
+_BLOCK_MARKER_TYPES = {
+    "doc",
+    "panel",
+    "expand",
+    "nestedExpand",
+    "table",
+    "mediaSingle",
+    "mediaGroup",
+    "media",
+    "caption",
+    "nested-table",
+    "extension",
+}
+
+# Canonical mark ordering used when emitting text nodes.
+MARK_ORDER: Dict[str, int] = {
+    "strong": 0,
+    "em": 1,
+    "code": 2,
+    "strike": 3,
+    "underline": 4,
+    "textColor": 5,
+    "backgroundColor": 6,
+    "subsup": 7,
+    "link": 8,
+    "border": 9,
+}
+
+# Canonical key ordering for emitted node dictionaries.
+NODE_KEY_ORDER: Dict[str, List[str]] = {
+    "doc": ["type", "version", "content"],
+    "text": ["type", "text", "marks"],
+}
+DEFAULT_NODE_KEY_ORDER: List[str] = ["type", "attrs", "content", "marks"]
+MARK_KEY_ORDER: List[str] = ["type", "attrs"]
+
+# Canonical key ordering for node attrs, by node type.
+ATTR_KEY_ORDER: Dict[str, List[str]] = {
+    "mention": ["id", "text", "userType", "accessLevel"],
+    "status": ["text", "color"],
+    "emoji": ["shortName", "id", "text"],
+    "date": ["timestamp"],
+    "media": ["id", "collection", "type", "width", "height", "alt"],
+    "mediaInline": ["id", "collection", "type", "width", "height", "alt"],
+    "mediaSingle": ["layout", "width", "widthType"],
+    "table": ["isNumberColumnEnabled", "layout", "displayMode", "width"],
+    "tableCell": ["colspan", "rowspan", "colwidth"],
+    "tableHeader": ["colspan", "rowspan", "colwidth"],
+    "extension": ["extensionType", "extensionKey", "text", "parameters"],
+    "heading": ["level"],
+    "panel": ["panelType"],
+    "expand": ["title"],
+    "nestedExpand": ["title"],
+}
+
+# Precomputed key-to-position indexes so canonical ordering is one sorted() pass.
+NODE_KEY_ORDER_INDEX: Dict[str, Dict[str, int]] = {
+    node_type: {key: index for index, key in enumerate(keys)}
+    for node_type, keys in NODE_KEY_ORDER.items()
+}
+DEFAULT_NODE_KEY_ORDER_INDEX: Dict[str, int] = {
+    key: index for index, key in enumerate(DEFAULT_NODE_KEY_ORDER)
+}
+MARK_KEY_ORDER_INDEX: Dict[str, int] = {key: index for index, key in enumerate(MARK_KEY_ORDER)}
+ATTR_KEY_ORDER_INDEX: Dict[str, Dict[str, int]] = {
+    node_type: {key: index for index, key in enumerate(keys)}
+    for node_type, keys in ATTR_KEY_ORDER.items()
+}
+_NO_KEY_ORDER: Dict[str, int] = {}
+
+# Shared default for nodes without marks; must never be mutated.
+_EMPTY_MARKS: List[Dict[str, Any]] = []
+
+# Singleton mark dicts shared across span parsing; must never be mutated.
+_MARK_STRONG: Dict[str, Any] = {"type": "strong"}
+_MARK_EM: Dict[str, Any] = {"type": "em"}
+_MARK_STRIKE: Dict[str, Any] = {"type": "strike"}
+_MARK_CODE: Dict[str, Any] = {"type": "code"}
+
+
+def _order_dict(data: Dict[str, Any], index: Dict[str, int]) -> Dict[str, Any]:
+    """Rebuild a dictionary with indexed keys first, preserving leftover order."""
+    return {key: data[key] for key in sorted(data, key=lambda k: index.get(k, 999))}
+
+
+def dumps_adf(node: Any) -> str:
+    """
+    Serialize ADF nodes to a JSON string with keys in canonical order.
+
+    Fuses the key-ordering and marks-defaulting passes of
+    :meth:`MarkdownParser.parse` into serialization, so callers that only
+    need the JSON string walk the tree once instead of rebuilding it first.
+
+    Args:
+        node: An ADF node dictionary or list of node dictionaries
+
+    Returns:
+        Canonically ordered JSON representation
+    """
+    return "".join(_encode_adf(node))
+
+
+def _encode_adf(value: Any, mode: str = "node", node_type: Optional[str] = None):
+    """Yield JSON fragments for a node tree, ordering keys on the fly."""
+    if isinstance(value, dict):
+        if mode == "attrs":
+            key_index = ATTR_KEY_ORDER_INDEX.get(node_type, _NO_KEY_ORDER)
+        elif mode == "mark":
+            key_index = MARK_KEY_ORDER_INDEX
+        else:
+            node_type = value.get("type")
+            key_index = NODE_KEY_ORDER_INDEX.get(node_type, DEFAULT_NODE_KEY_ORDER_INDEX)
+        keys = sorted(value, key=lambda k: key_index.get(k, 999))
+        if mode == "node" and node_type == "text" and "marks" not in value:
+            keys.append("marks")
+        yield "{"
+        first = True
+        for key in keys:
+            if not first:
+                yield ", "
+            first = False
+            yield json.dumps(key)
+            yield ": "
+            if mode == "mark":
+                yield json.dumps(value.get(key))
+            elif mode == "node" and key == "marks":
+                marks = value.get("marks", [])
+                if len(marks) > 1:
+                    marks = sorted(marks, key=_mark_sort_key)
+                yield "["
+                mark_first = True
+                for mark in marks:
+                    if not mark_first:
+                        yield ", "
+                    mark_first = False
+                    yield from _encode_adf(mark, "mark")
+                yield "]"
+            elif mode == "node" and key == "attrs" and isinstance(value[key], dict):
+                yield from _encode_adf(value[key], "attrs", node_type)
+            else:
+                yield from _encode_adf(value[key])
+        yield "}"
+    elif isinstance(value, list):
+        yield "["
+        first = True
+        for item in value:
+            if not first:
+                yield ", "
+            first = False
+            yield from _encode_adf(item)
+        yield "]"
+    else:
+        yield json.dumps(value)
+
+
+_MARK_ORDER_GET = MARK_ORDER.get
+
+
+def _mark_sort_key(mark: Dict[str, Any]) -> Tuple[int, str]:
+    """Sort key placing marks into the canonical ADF order."""
+    mark_type = mark.get("type", "")
+    return (_MARK_ORDER_GET(mark_type, 99), mark_type)
+
+
+def _parse_attrs_fast(attr_str: str) -> List[Tuple[str, str]]:
+    """Scan ``key="value"`` pairs with one forward pass and no regex."""
+    pairs: List[Tuple[str, str]] = []
+    find = attr_str.find
+    i = 0
+    length = len(attr_str)
+    while i < length:
+        eq = find('="', i)
+        if eq < 0:
+            break
+        key_start = i
+        while key_start < eq and attr_str[key_start] in " ,":
+            key_start += 1
+        value_end = find('"', eq + 2)
+        if value_end < 0:
+            break
+        pairs.append((attr_str[key_start:eq], attr_str[eq + 2 : value_end]))
+        i = value_end + 1
+    return pairs
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_attrs_cached(attr_str: str) -> Tuple[Tuple[str, str], ...]:
+    """Parse a marker attribute string into (key, value) pairs.
+
+    Cached because cells within one table typically repeat identical
+    attribute strings; callers must not mutate via the returned tuple.
+    """
+    pairs = _parse_attrs_fast(attr_str)
+    if pairs:
+        return tuple(pairs)
+    attrs: List[Tuple[str, str]] = []
+    for part in _ATTR_SPLIT_RE.findall(attr_str):
+        if "=" in part and part.strip():
+            key, value = part.split("=", 1)
+            attrs.append((key.strip(), value.strip().strip('"')))
+    return tuple(attrs)
+
+
+def _marks_signature(marks: List[Dict[str, Any]]) -> Tuple[Any, ...]:
+    """Build a hashable signature for a list of marks (types plus scalar attrs)."""
+    return tuple(
+        (mark.get("type"), tuple(sorted(mark.get("attrs", {}).items())))
+        for mark in marks
+    )
+
+
+def _strip_bq(line: str) -> str:
+    """Strip one leading blockquote prefix (``>`` plus optional space) from a line."""
+    i = 0
+    n = len(line)
+    while i < n and line[i] in " \t":
+        i += 1
+    if i < n and line[i] == ">":
+        i += 1
+        if i < n and line[i] == " ":
+            i += 1
+        return line[i:]
+    return line
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_number(value: Optional[str]) -> Any:
+    """Parse a marker attribute value into int or float, falling back to the raw value."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+
+class MarkdownParser:
+    """
+    Parser for Markdown produced by the ADF to Markdown converters.
+
+    Reconstructs ADF node dictionaries from markdown text, using the
+    embedded ``<!-- ADF:... -->`` markers to recover node types and
+    attributes that plain markdown cannot express.
+    """
+
+    def __init__(self):
+        self._nested_tables: Dict[str, Dict[str, Any]] = {}
+        self._span_cache: Dict[Tuple[str, Tuple[Any, ...]], Tuple[Dict[str, Any], ...]] = {}
+        self._inline_handlers = {
+            "text": self._handle_inline_text,
+            "mention": self._handle_inline_mention,
+            "status": self._handle_inline_status,
+            "emoji": self._handle_inline_emoji,
+            "date": self._handle_inline_date,
+            "mediaInline": self._handle_inline_media,
+            "extension": self._handle_inline_extension,
+        }
+
+    def reset(self) -> None:
+        """Clear per-document state so the parser can be reused for another document."""
+        self._nested_tables.clear()
+        self._span_cache.clear()
+
+    def parse(self, markdown: str) -> Any:
+        """
+        Parse a Markdown string into ADF node dictionaries.
+
+        Args:
+            markdown: Markdown text to parse
+
+        Returns:
+            A single ADF node dictionary, or a list of node dictionaries
+            when the markdown contains multiple top-level blocks
+        """
+        lines = markdown.splitlines()
+        nodes, _ = self._parse_blocks(lines, 0, len(lines))
+        self._attach_nested_tables(nodes)
+        self._ensure_text_marks_recursive(nodes)
+        nodes = [self._order_node(node) for node in nodes]
+        if len(nodes) == 1:
+            return nodes[0]
+        return nodes
+
+    ################################################################################################
+    # Block-level parsing
+    ################################################################################################
+
+    def _parse_blocks(
+        self, lines: List[str], start: int, end: int, skip: Optional[Set[int]] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Parse lines[start:end] into a list of block-level ADF nodes.
+
+        Args:
+            lines: Full line list of the document
+            start: First line index to parse
+            end: One past the last line index to parse
+            skip: Optional line indices to ignore (e.g. anchor lines)
+        """
+        nodes: List[Dict[str, Any]] = []
+        i = start
+        while i < end:
+            if skip is not None and i in skip:
+                i += 1
+                continue
+            line = lines[i]
+            if not line.strip():
+                i += 1
+                continue
+
+            probe = _BLOCK_START_RE.match(line)
+            kind = probe.lastgroup if probe else None
+
+            if kind == "marker":
+                start_marker = START_MARKER_RE.match(line)
+                marker_type = start_marker.group(1)
+                if marker_type not in _BLOCK_MARKER_TYPES:
+                    kind = None
+                else:
+                    attrs = self._parse_attrs(start_marker.group(2) or "")
+                    if marker_type == "doc":
+                        end_idx = self._find_end(lines, i + 1, end, "doc")
+                        content, _ = self._parse_blocks(lines, i + 1, end_idx)
+                        node = {"type": "doc"}
+                        version = _parse_number(attrs.get("version"))
+                        if version is not None:
+                            node["version"] = version
+                        node["content"] = content
+                        nodes.append(node)
+                        i = min(end_idx + 1, end)
+                    elif marker_type == "panel":
+                        end_idx = self._find_end(lines, i + 1, end, "panel")
+                        nodes.append(self._parse_panel(lines, i + 1, end_idx, attrs))
+                        i = min(end_idx + 1, end)
+                    elif marker_type in ("expand", "nestedExpand"):
+                        end_idx = self._find_end(lines, i + 1, end, marker_type)
+                        nodes.append(self._parse_expand(lines, i + 1, end_idx, attrs, marker_type))
+                        i = min(end_idx + 1, end)
+                    elif marker_type == "table":
+                        end_idx = self._find_end(lines, i + 1, end, "table")
+                        nodes.append(self._parse_table(lines, i + 1, end_idx, attrs))
+                        i = min(end_idx + 1, end)
+                    elif marker_type == "mediaSingle":
+                        end_idx = self._find_end(lines, i + 1, end, "mediaSingle")
+                        nodes.append(self._parse_media_single(lines, i + 1, end_idx, attrs))
+                        i = min(end_idx + 1, end)
+                    elif marker_type == "mediaGroup":
+                        end_idx = self._find_end(lines, i + 1, end, "mediaGroup")
+                        nodes.append(self._parse_media_group(lines, i + 1, end_idx))
+                        i = min(end_idx + 1, end)
+                    elif marker_type == "media":
+                        node, i = self._parse_media_block(lines, i, end)
+                        nodes.append(node)
+                    elif marker_type == "caption":
+                        end_idx = self._find_end(lines, i + 1, end, "caption")
+                        nodes.append(self._parse_caption_block(lines, i + 1, end_idx))
+                        i = min(end_idx + 1, end)
+                    elif marker_type == "nested-table":
+                        end_idx = self._find_end(lines, i + 1, end, "nested-table")
+                        self._parse_nested_table(lines, i + 1, end_idx, attrs.get("ref"))
+                        i = min(end_idx + 1, end)
+                    elif marker_type == "extension":
+                        inner, i = self._collect_until_end(lines, i + 1, end, "extension")
+                        nodes.append(self._parse_extension_block(inner, attrs))
+                    continue
+
+            if kind == "fence":
+                node, i = self._parse_code_block(lines, i, end)
+                nodes.append(node)
+                continue
+
+            if kind == "bq":
+                node, i = self._parse_blockquote(lines, i, end)
+                nodes.append(node)
+                continue
+
+            if kind == "list":
+                node, i = self._parse_list(lines, i, end)
+                nodes.append(node)
+                continue
+
+            if kind == "head":
+                heading_match = _HEADING_RE.match(line)
+                nodes.append(
+                    {
+                        "type": "heading",
+                        "attrs": {"level": len(heading_match.group(1))},
+                        "content": self._parse_inlines(heading_match.group(2)),
+                    }
+                )
+                i += 1
+                continue
+
+            if kind == "rule":
+                nodes.append({"type": "rule"})
+                i += 1
+                continue
+
+            para_lines, i = self._collect_paragraph(lines, i, end)
+            node = self._parse_paragraph(para_lines)
+            if node is not None:
+                nodes.append(node)
+        return nodes, i
+
+    def _find_end(self, lines: List[str], i: int, end: int, marker_type: str) -> int:
+        """Return the index of the matching ``<!-- /ADF:marker_type -->`` line, or end."""
+        while i < end:
+            end_match = END_MARKER_RE.match(lines[i])
+            if end_match is not None and end_match.group(1) == marker_type:
+                return i
+            i += 1
+        return end
+
+    def _collect_until_end(
+        self, lines: List[str], i: int, end: int, marker_type: str
+    ) -> Tuple[List[str], int]:
+        """Collect lines up to the matching ``<!-- /ADF:marker_type -->`` end marker."""
+        inner: List[str] = []
+        while i < end:
+            end_match = END_MARKER_RE.match(lines[i])
+            if end_match is not None and end_match.group(1) == marker_type:
+                return inner, i + 1
+            inner.append(lines[i])
+            i += 1
+        return inner, i
+
+    def _collect_paragraph(self, lines: List[str], i: int, end: int) -> Tuple[List[str], int]:
+        """Collect consecutive lines belonging to one paragraph."""
+        para_lines = [lines[i]]
+        i += 1
+        while i < end:
+            line = lines[i]
+            if not line.strip():
+                break
+            if line.startswith("```"):
+                break
+            if _BQ_LINE_RE.match(line):
+                break
+            start_marker = START_MARKER_RE.match(line)
+            if start_marker and start_marker.group(1) in _BLOCK_MARKER_TYPES:
+                break
+            if END_MARKER_RE.match(line):
+                break
+            if _LIST_RE.match(line):
+                break
+            if _HEADING_RE.match(line):
+                break
+            if _RULE_RE.match(line):
+                break
+            para_lines.append(line)
+            i += 1
+        return para_lines, i
+
+    def _parse_paragraph(self, para_lines: List[str]) -> Optional[Dict[str, Any]]:
+        """Build a paragraph node from its collected lines, honoring hard breaks."""
+        nodes: List[Dict[str, Any]] = []
+        previous_break = False
+        for index, line in enumerate(para_lines):
+            if index > 0:
+                if previous_break:
+                    nodes.append({"type": "hardBreak"})
+                else:
+                    nodes.append({"type": "text", "text": " "})
+            previous_break = line.endswith("  ")
+            if previous_break:
+                line = line[:-2]
+            nodes.extend(self._parse_inlines(line))
+        if not nodes:
+            return None
+        return {"type": "paragraph", "content": self._merge_text_nodes(nodes)}
+
+    def _parse_code_block(self, lines: List[str], i: int, end: int) -> Tuple[Dict[str, Any], int]:
+        """Parse a fenced code block into a codeBlock node."""
+        language = lines[i][3:].strip()
+        i += 1
+        content: List[str] = []
+        while i < end and not lines[i].startswith("```"):
+            content.append(lines[i])
+            i += 1
+        i += 1  # skip closing fence
+        node: Dict[str, Any] = {"type": "codeBlock"}
+        if language:
+            node["attrs"] = {"language": language}
+        text_node: Dict[str, Any] = {"type": "text"}
+        if content:
+            text_node["text"] = "\n".join(content)
+        node["content"] = [text_node]
+        return node, i
+
+    def _parse_blockquote(self, lines: List[str], i: int, end: int) -> Tuple[Dict[str, Any], int]:
+        """Parse consecutive ``>`` quoted lines into a blockquote node."""
+        quote_lines: List[str] = []
+        while i < end and _BQ_LINE_RE.match(lines[i]):
+            quote_lines.append(lines[i])
+            i += 1
+        dequoted = [_strip_bq(line) for line in quote_lines]
+        content, _ = self._parse_blocks(dequoted, 0, len(dequoted))
+        return {"type": "blockquote", "content": content}, i
+
+    def _parse_panel(
+        self, lines: List[str], start: int, end: int, attrs: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Parse the quoted body of a panel marker into a panel node."""
+        dequoted = [_strip_bq(lines[j]) for j in range(start, end)]
+        if attrs.get("panelType"):
+            # Drop the synthetic "**INFO**" label line emitted for display purposes.
+            dequoted = dequoted[1:]
+        content, _ = self._parse_blocks(dequoted, 0, len(dequoted))
+        node: Dict[str, Any] = {"type": "panel"}
+        if attrs.get("panelType"):
+            node["attrs"] = {"panelType": attrs["panelType"]}
+        node["content"] = content
+        return node
+
+    def _parse_expand(
+        self, lines: List[str], start: int, end: int, attrs: Dict[str, str], node_type: str
+    ) -> Dict[str, Any]:
+        """Parse the body of an expand/nestedExpand marker, skipping the title echo line."""
+        content_start = start
+        index = start
+        while index < end and not lines[index].strip():
+            index += 1
+        if index < end and _EXPAND_TITLE_RE.match(lines[index].strip()):
+            content_start = index + 1
+        content, _ = self._parse_blocks(lines, content_start, end)
+        node: Dict[str, Any] = {"type": node_type}
+        if attrs.get("title"):
+            node["attrs"] = {"title": attrs["title"]}
+        node["content"] = content
+        return node
+
+    def _parse_list(self, lines: List[str], i: int, end: int) -> Tuple[Dict[str, Any], int]:
+        """Parse consecutive list lines into a bulletList/orderedList tree."""
+        entries: List[Tuple[int, bool, str]] = []
+        while i < end:
+            match = _LIST_RE.match(lines[i])
+            if not match:
+                break
+            level = len(match.group(1)) // 4
+            ordered = match.group(2) != "- "
+            entries.append((level, ordered, match.group(3)))
+            i += 1
+        node, _ = self._build_list(entries, 0, 0)
+        return node, i
+
+    def _build_list(
+        self, entries: List[Tuple[int, bool, str]], index: int, level: int
+    ) -> Tuple[Dict[str, Any], int]:
+        """Build one list node from pre-scanned (level, ordered, text) entries."""
+        list_type = "orderedList" if entries[index][1] else "bulletList"
+        items: List[Dict[str, Any]] = []
+        while index < len(entries) and entries[index][0] >= level:
+            if entries[index][0] > level:
+                nested, index = self._build_list(entries, index, entries[index][0])
+                if items:
+                    items[-1]["content"].append(nested)
+                continue
+            items.append(
+                {
+                    "type": "listItem",
+                    "content": [
+                        {"type": "paragraph", "content": self._parse_inlines(entries[index][2])}
+                    ],
+                }
+            )
+            index += 1
+        return {"type": list_type, "content": items}, index
+
+    ################################################################################################
+    # Table parsing
+    ################################################################################################
+
+    def _parse_table(
+        self, lines: List[str], start: int, end: int, attrs: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Parse the body of a table marker into a table node."""
+        # Both flags apply to the whole table, so resolve them in one pass
+        # (instead of two any() scans) before parsing rows.
+        has_cell_attrs = False
+        has_strong_text = False
+        for j in range(start, end):
+            line = lines[j]
+            if not has_cell_attrs and _CELL_ATTR_RE.search(line):
+                has_cell_attrs = True
+            if not has_strong_text and "**" in line:
+                has_strong_text = True
+            if has_cell_attrs and has_strong_text:
+                break
+        rows: List[Dict[str, Any]] = []
+        for j in range(start, end):
+            stripped = lines[j].strip()
+            if not stripped:
+                continue
+            if not stripped.startswith("|"):
+                continue
+            if _TABLE_SEPARATOR_RE.match(stripped):
+                continue  # separator row
+            row = self._parse_table_row(stripped, has_cell_attrs, has_strong_text)
+            if row is not None:
+                rows.append(row)
+        node: Dict[str, Any] = {"type": "table"}
+        table_attrs = self._parse_table_attrs(attrs)
+        if table_attrs:
+            node["attrs"] = table_attrs
+        node["content"] = rows
+        return node
+
+    def _parse_table_attrs(self, attrs: Dict[str, str]) -> Dict[str, Any]:
+        """Convert raw table marker attributes into table node attrs."""
+        table_attrs: Dict[str, Any] = {}
+        if attrs.get("isNumberColumnEnabled") == "true":
+            table_attrs["isNumberColumnEnabled"] = True
+        if attrs.get("layout"):
+            table_attrs["layout"] = attrs["layout"]
+        if attrs.get("displayMode"):
+            table_attrs["displayMode"] = attrs["displayMode"]
+        if attrs.get("width"):
+            table_attrs["width"] = _parse_number(attrs["width"])
+        return table_attrs
+
+    def _parse_table_row(
+        self, line: str, has_cell_attrs: bool, has_strong_text: bool
+    ) -> Optional[Dict[str, Any]]:
+        """Parse one markdown table row into a tableRow node."""
+        cells: List[Dict[str, Any]] = []
+        for match in _CELL_BLOCK_RE.finditer(line):
+            cells.append(
+                self._build_cell(match.group(1), match.group(2), match.group(3), has_cell_attrs)
+            )
+        if not cells:
+            # Plain markdown row without cell markers.
+            for segment in line.split("|"):
+                segment = segment.strip()
+                if not segment:
+                    continue  # spanned or boundary position
+                cell = self._parse_table_cell(segment, has_cell_attrs, has_strong_text)
+                if cell is not None:
+                    cells.append(cell)
+        if not cells:
+            return None
+        return {"type": "tableRow", "content": cells}
+
+    def _build_cell(
+        self, cell_type: str, attrs_raw: Optional[str], inner: str, has_cell_attrs: bool
+    ) -> Dict[str, Any]:
+        """Build a tableCell/tableHeader node from captured marker groups."""
+        node: Dict[str, Any] = {"type": cell_type}
+        if has_cell_attrs:
+            cell_attrs = self._parse_cell_attrs(self._parse_attrs(attrs_raw or ""))
+            if cell_attrs:
+                node["attrs"] = cell_attrs
+        node["content"] = self._parse_cell_content(inner)
+        return node
+
+    def _parse_table_cell(
+        self, cell: str, has_cell_attrs: bool, has_strong_text: bool
+    ) -> Optional[Dict[str, Any]]:
+        """Parse one cell segment into a tableCell/tableHeader node."""
+        start_match = INLINE_MARKER_RE.search(cell)
+        if not start_match or start_match.group(1) not in ("tableCell", "tableHeader"):
+            # Plain markdown cell without ADF markers.
+            if has_strong_text:
+                content = self._parse_inlines(cell)
+            else:
+                content = [{"type": "text", "text": cell}]
+            return {"type": "tableCell", "content": [{"type": "paragraph", "content": content}]}
+        cell_type = start_match.group(1)
+        end_marker = f"<!-- /ADF:{cell_type} -->"
+        end_pos = cell.find(end_marker, start_match.end())
+        if end_pos >= 0:
+            inner = cell[start_match.end() : end_pos]
+        else:
+            inner = cell[start_match.end() :]
+        node: Dict[str, Any] = {"type": cell_type}
+        if has_cell_attrs:
+            cell_attrs = self._parse_cell_attrs(self._parse_attrs(start_match.group(2) or ""))
+            if cell_attrs:
+                node["attrs"] = cell_attrs
+        node["content"] = self._parse_cell_content(inner)
+        return node
+
+    def _parse_cell_attrs(self, attrs: Dict[str, str]) -> Dict[str, Any]:
+        """Convert raw cell marker attributes into tableCell/tableHeader attrs."""
+        cell_attrs: Dict[str, Any] = {}
+        colspan = attrs.get("colspan")
+        if colspan is not None:
+            cell_attrs["colspan"] = int(colspan)
+        rowspan = attrs.get("rowspan")
+        if rowspan is not None:
+            cell_attrs["rowspan"] = int(rowspan)
+        colwidth = attrs.get("colwidth")
+        if colwidth:
+            cell_attrs["colwidth"] = [float(value) for value in colwidth.split(",")]
+        return cell_attrs
+
+    def _parse_cell_content(self, inner: str) -> List[Dict[str, Any]]:
+        """Parse cell text with ``<br/>`` separators into block-level content."""
+        blocks: List[Dict[str, Any]] = []
+        cursor = 0
+        length = len(inner)
+        while cursor < length:
+            match = INLINE_MARKER_RE.search(inner, cursor)
+            if match and match.group(1) == "extension":
+                if match.start() > cursor:
+                    self._append_cell_paragraphs(blocks, inner[cursor : match.start()])
+                attrs = self._parse_attrs(match.group(2) or "")
+                end_marker = "<!-- /ADF:extension -->"
+                end_pos = inner.find(end_marker, match.end())
+                blocks.append(self._build_extension_placeholder(attrs))
+                if end_pos >= 0:
+                    cursor = end_pos + len(end_marker)
+                else:
+                    cursor = length
+            else:
+                self._append_cell_paragraphs(blocks, inner[cursor:] if cursor else inner)
+                break
+        return blocks
+
+    def _append_cell_paragraphs(self, blocks: List[Dict[str, Any]], text: str) -> None:
+        """Append paragraph nodes parsed from a cell text fragment."""
+        for chunk in text.split("<br/><br/>"):
+            content: List[Dict[str, Any]] = []
+            for index, part in enumerate(chunk.split("<br/>")):
+                if index > 0:
+                    content.append({"type": "hardBreak"})
+                content.extend(self._parse_inlines(part))
+            if content:
+                blocks.append({"type": "paragraph", "content": content})
+
+    ################################################################################################
+    # Media parsing
+    ################################################################################################
+
+    def _parse_media_single(
+        self, lines: List[str], start: int, end: int, attrs: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Parse the body of a mediaSingle marker into a mediaSingle node."""
+        node_attrs: Dict[str, Any] = {}
+        if attrs.get("layout"):
+            node_attrs["layout"] = attrs["layout"]
+        if attrs.get("width") is not None:
+            node_attrs["width"] = _parse_number(attrs.get("width"))
+        if attrs.get("widthType"):
+            node_attrs["widthType"] = attrs["widthType"]
+        content, _ = self._parse_blocks(lines, start, end)
+        node: Dict[str, Any] = {"type": "mediaSingle"}
+        if node_attrs:
+            node["attrs"] = node_attrs
+        node["content"] = content
+        return node
+
+    def _parse_media_group(self, lines: List[str], start: int, end: int) -> Dict[str, Any]:
+        """Parse the body of a mediaGroup marker into a mediaGroup node."""
+        content, _ = self._parse_blocks(lines, start, end)
+        return {"type": "mediaGroup", "content": content}
+
+    def _parse_media_block(self, lines: List[str], i: int, end: int) -> Tuple[Dict[str, Any], int]:
+        """Parse a media marker block (marker, display link, end marker)."""
+        start_match = START_MARKER_RE.match(lines[i])
+        attrs = self._parse_attrs(start_match.group(2) or "")
+        i += 1
+        while i < end:
+            m = END_MARKER_RE.match(lines[i])
+            if m and m.group(1) == "media":
+                i += 1
+                break
+            i += 1
+        _get = attrs.get
+        width = _get("width")
+        height = _get("height")
+        raw = (
+            ("id", _get("id")),
+            ("collection", _get("collection")),
+            ("type", _get("type")),
+            ("width", _parse_number(width) if width is not None else None),
+            ("height", _parse_number(height) if height is not None else None),
+            ("alt", _get("alt") or None),
+        )
+        node_attrs: Dict[str, Any] = {key: value for key, value in raw if value is not None}
+        node: Dict[str, Any] = {"type": "media", "attrs": node_attrs}
+        marks = self._parse_border_marks(attrs)
+        if marks:
+            node["marks"] = marks
+        return node, i
+
+    def _parse_media_inline(self, attrs: Dict[str, str]) -> Dict[str, Any]:
+        """Build a mediaInline node from its marker attributes."""
+        _get = attrs.get
+        width = _get("width")
+        height = _get("height")
+        raw = (
+            ("id", _get("id")),
+            ("collection", _get("collection")),
+            ("type", _get("type")),
+            ("width", _parse_number(width) if width is not None else None),
+            ("height", _parse_number(height) if height is not None else None),
+            ("alt", _get("alt") or None),
+        )
+        node_attrs: Dict[str, Any] = {key: value for key, value in raw if value is not None}
+        node: Dict[str, Any] = {"type": "mediaInline", "attrs": node_attrs}
+        marks = self._parse_border_marks(attrs)
+        if marks:
+            node["marks"] = marks
+        return node
+
+    def _parse_border_marks(self, attrs: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Build a border mark list from media marker attributes, if present."""
+        size = attrs.get("borderSize")
+        color = attrs.get("borderColor")
+        if size is None and color is None:
+            return []
+        border_attrs: Dict[str, Any] = {}
+        if size is not None:
+            border_attrs["size"] = _parse_number(size)
+        if color is not None:
+            border_attrs["color"] = color
+        return [{"type": "border", "attrs": border_attrs}]
+
+    def _parse_caption_block(self, lines: List[str], start: int, end: int) -> Dict[str, Any]:
+        """Parse a caption marker body into a caption node, stripping the italics wrapper."""
+        text = "\n".join(
+            stripped for line in lines[start:end] if (stripped := line.strip())
+        )
+        if len(text) >= 2 and text.startswith("*") and text.endswith("*"):
+            text = text[1:-1]
+        return {"type": "caption", "content": [{"type": "text", "text": text}]}
+
+    ################################################################################################
+    # Nested table handling
+    ################################################################################################
+
+    def _parse_nested_table(
+        self, lines: List[str], start: int, end: int, ref: Optional[str]
+    ) -> None:
+        """Parse a nested-table appendix block and record its document under its ref."""
+        anchor_lines = {
+            j for j in range(start, end) if lines[j].lstrip().startswith("<a name=")
+        }
+        content, _ = self._parse_blocks(lines, start, end, skip=anchor_lines or None)
+        if ref and content:
+            self._nested_tables[ref] = content[0]
+
+    def _parse_extension_block(self, inner_lines: List[str], attrs: Dict[str, str]) -> Dict[str, Any]:
+        """Parse a block-level extension marker wrapping an inline nested-table document."""
+        content_nodes, _ = self._parse_blocks(inner_lines, 0, len(inner_lines))
+        parameters: Dict[str, Any] = {}
+        if content_nodes:
+            doc_node = content_nodes[0]
+            parameters["adf"] = _dumps_compact(doc_node)
+        node: Dict[str, Any] = {
+            "type": "extension",
+            "attrs": {
+                "extensionType": attrs.get("extensionType"),
+                "extensionKey": attrs.get("extensionKey"),
+                "text": "",
+                "parameters": parameters,
+            },
+        }
+        return node
+
+    def _build_extension_placeholder(self, attrs: Dict[str, str]) -> Dict[str, Any]:
+        """Build an extension node for an inline nested-table reference."""
+        node: Dict[str, Any] = {
+            "type": "extension",
+            "attrs": {
+                "extensionType": attrs.get("extensionType"),
+                "extensionKey": attrs.get("extensionKey"),
+                "text": "",
+            },
+        }
+        ref = attrs.get("ref")
+        if ref:
+            node["_ref"] = ref
+        return node
+
+    def _walk_nodes(self, nodes: List[Dict[str, Any]]):
+        """Yield all nodes in the tree, depth-first, without materializing a list."""
+        stack = list(reversed(nodes))
+        while stack:
+            node = stack.pop()
+            yield node
+            content = node.get("content")
+            if isinstance(content, list):
+                stack.extend(reversed(content))
+
+    def _attach_nested_tables(self, nodes: List[Dict[str, Any]]) -> None:
+        """Resolve nested-table references into serialized extension parameters."""
+        for node in self._walk_nodes(nodes):
+            if node.get("type") != "extension":
+                continue
+            ref = node.pop("_ref", None)
+            if ref is None:
+                continue
+            parameters: Dict[str, Any] = {}
+            doc_node = self._nested_tables.get(ref)
+            if doc_node is not None:
+                parameters["adf"] = _dumps_compact(doc_node)
+            node["attrs"]["parameters"] = parameters
+
+    ################################################################################################
+    # Inline parsing
+    ################################################################################################
+
+    def _parse_inlines(self, text: str) -> List[Dict[str, Any]]:
+        """Parse inline text, handling embedded ADF markers and markdown spans."""
+        if "<!-- ADF:" not in text:
+            # Most lines carry no markers; go straight to span parsing.
+            return self._merge_text_nodes(self._parse_markdown_spans(text, []))
+        nodes: List[Dict[str, Any]] = []
+        cursor = 0
+        length = len(text)
+        # Bind hot lookups locally; this loop dominates large conversions.
+        marker_match = INLINE_MARKER_RE.match
+        marker_search = INLINE_MARKER_RE.search
+        find = text.find
+        parse_spans = self._parse_markdown_spans
+        handler_get = self._inline_handlers.get
+        extend = nodes.extend
+        while cursor < length:
+            # All markers share a literal prefix; str.find skips ahead much
+            # faster than a regex scan. The regex then validates the header.
+            start = find("<!-- ADF:", cursor)
+            if start < 0:
+                extend(parse_spans(text[cursor:], []))
+                break
+            match = marker_match(text, start)
+            if match is None:
+                # Malformed header; fall back to a regex scan past it.
+                match = marker_search(text, start + 1)
+            if not match:
+                extend(parse_spans(text[cursor:], []))
+                break
+            if match.start() > cursor:
+                extend(parse_spans(text[cursor : match.start()], []))
+            marker_type = match.group(1)
+            attrs = self._parse_attrs(match.group(2) or "")
+            end_marker = f"<!-- /ADF:{marker_type} -->"
+            end_pos = find(end_marker, match.end())
+            if end_pos < 0:
+                extend(parse_spans(text[match.start() :], []))
+                break
+            inner = text[match.end() : end_pos]
+            handler = handler_get(marker_type)
+            if handler is not None:
+                handler(nodes, inner, attrs)
+            cursor = end_pos + len(end_marker)
+        return self._merge_text_nodes(nodes)
+
+    def _handle_inline_text(
+        self, nodes: List[Dict[str, Any]], inner: str, attrs: Dict[str, str]
+    ) -> None:
+        """Handle an inline text marker carrying explicit marks."""
+        marks = self._parse_mark_attrs(attrs.get("marks", ""))
+        nodes.extend(self._parse_markdown_spans(inner, marks))
+
+    def _handle_inline_mention(
+        self, nodes: List[Dict[str, Any]], inner: str, attrs: Dict[str, str]
+    ) -> None:
+        """Handle an inline mention marker."""
+        nodes.append({"type": "mention", "attrs": dict(attrs)})
+
+    def _handle_inline_status(
+        self, nodes: List[Dict[str, Any]], inner: str, attrs: Dict[str, str]
+    ) -> None:
+        """Handle an inline status marker."""
+        nodes.append({"type": "status", "attrs": dict(attrs)})
+
+    def _handle_inline_emoji(
+        self, nodes: List[Dict[str, Any]], inner: str, attrs: Dict[str, str]
+    ) -> None:
+        """Handle an inline emoji marker."""
+        nodes.append({"type": "emoji", "attrs": dict(attrs)})
+
+    def _handle_inline_date(
+        self, nodes: List[Dict[str, Any]], inner: str, attrs: Dict[str, str]
+    ) -> None:
+        """Handle an inline date marker."""
+        nodes.append({"type": "date", "attrs": dict(attrs)})
+
+    def _handle_inline_media(
+        self, nodes: List[Dict[str, Any]], inner: str, attrs: Dict[str, str]
+    ) -> None:
+        """Handle an inline media marker."""
+        nodes.append(self._parse_media_inline(attrs))
+
+    def _handle_inline_extension(
+        self, nodes: List[Dict[str, Any]], inner: str, attrs: Dict[str, str]
+    ) -> None:
+        """Handle an inline nested-table extension reference."""
+        nodes.append(self._build_extension_placeholder(attrs))
+
+    def _parse_mark_attrs(self, marks_str: str) -> List[Dict[str, Any]]:
+        """Parse a ``marks="..."`` marker attribute into mark dictionaries."""
+        marks: List[Dict[str, Any]] = []
+        for token in marks_str.split(","):
+            token = token.strip()
+            if not token:
+                continue
+            if "=" in token:
+                mark_type, value = token.split("=", 1)
+                if mark_type == "subsup":
+                    marks.append({"type": "subsup", "attrs": {"type": value}})
+                else:
+                    marks.append({"type": mark_type, "attrs": {"color": value}})
+            else:
+                marks.append({"type": token})
+        return marks
+
+    def _parse_markdown_spans(
+        self, text: str, active_marks: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Parse markdown spans, memoized per document on (text, marks signature).
+
+        Table cells and templated content repeat identical snippets; cache
+        hits skip the whole span scan. Cached nodes are returned as shallow
+        copies so downstream merging can mutate them safely.
+        """
+        key = (text, _marks_signature(active_marks))
+        cached = self._span_cache.get(key)
+        if cached is None:
+            cached = tuple(self._parse_markdown_spans_impl(text, active_marks))
+            self._span_cache[key] = cached
+        return [dict(node) for node in cached]
+
+    def _parse_markdown_spans_impl(
+        self, text: str, active_marks: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Parse markdown emphasis/code/link spans into text nodes with marks.
+
+        Nested spans are handled with an explicit frame stack instead of
+        recursion: each frame scans one segment under its mark stack, and
+        child segments are pushed with the extended marks. Nodes are emitted
+        into one flat list in document order.
+        """
+        if not _INLINE_SPECIAL_RE.search(text):
+            # Plain text: skip the span scan entirely.
+            node = self._make_text(text, active_marks)
+            return [node] if node else []
+        nodes: List[Dict[str, Any]] = []
+        make_text = self._make_text
+        append_text = self._append_text
+        # Frame layout: [match iterator, segment text, cursor, mark stack].
+        stack = [[INLINE_SPAN_RE.finditer(text), text, 0, active_marks]]
+        while stack:
+            frame = stack[-1]
+            match = next(frame[0], None)
+            if match is None:
+                segment = frame[1]
+                if frame[2] < len(segment):
+                    node = make_text(segment[frame[2] :], frame[3])
+                    if node:
+                        append_text(nodes, node)
+                stack.pop()
+                continue
+            segment, cursor, marks = frame[1], frame[2], frame[3]
+            if match.start() > cursor:
+                node = make_text(segment[cursor : match.start()], marks)
+                if node:
+                    append_text(nodes, node)
+            frame[2] = match.end()
+            name = match.lastgroup
+            inner = match.group(_SPAN_INNER[name])
+            if name == "code":
+                node = make_text(inner, marks + [_MARK_CODE])
+                if node:
+                    append_text(nodes, node)
+                continue
+            if name == "link":
+                url = match.group(_SPAN_INNER[name] + 1)
+                if inner == url and not marks:
+                    nodes.append({"type": "inlineCard", "attrs": {"url": url}})
+                    continue
+                child_marks = marks + [{"type": "link", "attrs": {"href": url}}]
+            elif name == "bold_italic":
+                child_marks = marks + [_MARK_STRONG, _MARK_EM]
+            elif name == "bold":
+                child_marks = marks + [_MARK_STRONG]
+            elif name == "strike":
+                child_marks = marks + [_MARK_STRIKE]
+            else:  # italic
+                child_marks = marks + [_MARK_EM]
+            if _INLINE_SPECIAL_RE.search(inner):
+                stack.append([INLINE_SPAN_RE.finditer(inner), inner, 0, child_marks])
+            else:
+                node = make_text(inner, child_marks)
+                if node:
+                    append_text(nodes, node)
+        return nodes
+
+    def _append_text(self, nodes: List[Dict[str, Any]], node: Dict[str, Any]) -> None:
+        """Append a node, folding text into the previous node when marks match."""
+        if nodes and node.get("type") == "text":
+            prev = nodes[-1]
+            if prev.get("type") == "text":
+                prev_marks = prev.get("marks", _EMPTY_MARKS)
+                node_marks = node.get("marks", _EMPTY_MARKS)
+                if (not prev_marks and not node_marks) or prev_marks == node_marks:
+                    prev["text"] = prev.get("text", "") + node.get("text", "")
+                    return
+        nodes.append(node)
+
+    def _make_text(self, text: str, marks: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Build a text node, or None for empty text."""
+        if not text:
+            return None
+        return {"type": "text", "text": text, "marks": self._normalize_marks(marks)}
+
+    def _merge_text_nodes(self, nodes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Merge adjacent text nodes carrying identical marks."""
+        merged: List[Dict[str, Any]] = []
+        run: List[str] = []
+        run_node: Optional[Dict[str, Any]] = None
+        for node in nodes:
+            if run_node is not None and node.get("type") == "text":
+                run_marks = run_node.get("marks", _EMPTY_MARKS)
+                node_marks = node.get("marks", _EMPTY_MARKS)
+                if (not run_marks and not node_marks) or run_marks == node_marks:
+                    run.append(node.get("text", ""))
+                    continue
+            if run_node is not None:
+                if len(run) > 1:
+                    run_node["text"] = "".join(run)
+                merged.append(run_node)
+                run_node = None
+            if node.get("type") == "text":
+                run_node = node
+                run = [node.get("text", "")]
+            else:
+                merged.append(node)
+        if run_node is not None:
+            if len(run) > 1:
+                run_node["text"] = "".join(run)
+            merged.append(run_node)
+        return merged
+
+    def _normalize_marks(self, marks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Sort marks into the canonical ADF order."""
+        if len(marks) <= 1:
+            return list(marks)
+        marks_list = list(marks)
+        marks_list.sort(key=_mark_sort_key)
+        return marks_list
+
+    ################################################################################################
+    # Marker attribute parsing
+    ################################################################################################
+
+    def _parse_attrs(self, attr_str: str) -> Dict[str, str]:
+        """Parse a marker attribute string into a key/value dictionary."""
+        if not attr_str:
+            return {}
+        return dict(_parse_attrs_cached(attr_str))
+
+    ################################################################################################
+    # Output normalization
+    ################################################################################################
+
+    def _ensure_text_marks_recursive(self, node: Any) -> None:
+        """Ensure every text node in the tree carries an explicit marks list."""
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if type(current) is dict:
+                if current.get("type") == "text" and "marks" not in current:
+                    current["marks"] = []
+                for value in current.values():
+                    if type(value) in (dict, list):
+                        stack.append(value)
+            elif type(current) is list:
+                stack.extend(current)
+
+    def _order_node(self, node: Any) -> Any:
+        """Rebuild a node dictionary with keys in canonical ADF order."""
+        if isinstance(node, list):
+            return [self._order_node(item) for item in node]
+        if not isinstance(node, dict):
+            return node
+        node_type = node.get("type")
+        if node_type == "hardBreak" or node_type == "rule":
+            return node
+        if (
+            node_type == "text"
+            and not node.get("marks")
+            and tuple(node.keys()) == ("type", "text", "marks")
+        ):
+            return node
+        key_index = NODE_KEY_ORDER_INDEX.get(node_type, DEFAULT_NODE_KEY_ORDER_INDEX)
+        result: Dict[str, Any] = {}
+        for key in sorted(node, key=lambda k: key_index.get(k, 999)):
+            value = node[key]
+            if key == "content":
+                result[key] = [self._order_node(child) for child in value]
+            elif key == "marks":
+                result[key] = [
+                    _order_dict(mark, MARK_KEY_ORDER_INDEX)
+                    for mark in self._normalize_marks(value)
+                ]
+            elif key == "attrs" and isinstance(value, dict):
+                result[key] = self._order_attrs(node_type, value)
+            elif isinstance(value, (dict, list)):
+                result[key] = self._order_node(value)
+            else:
+                result[key] = value
+        return result
+
+    def _order_attrs(self, node_type: Optional[str], attrs: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild a node's attrs dictionary in canonical order, recursing into nested values."""
+        attr_index = ATTR_KEY_ORDER_INDEX.get(node_type, _NO_KEY_ORDER)
+        result: Dict[str, Any] = {}
+        for key in sorted(attrs, key=lambda k: attr_index.get(k, 999)):
+            value = attrs[key]
+            if isinstance(value, (dict, list)):
+                value = self._order_node(value)
+            result[key] = value
+        return result
+
+
+class MD2ADFRegistry:
+    """Registry for Markdown to ADF conversion."""
+
+    def __init__(self):
+        self.parser = MarkdownParser()
+
+    @classmethod
+    def create_default(cls) -> "MD2ADFRegistry":
+        """Create a registry with the default Markdown parser."""
+        return cls()
+
+    def convert(self, markdown: str) -> Any:
+        """
+        Convert a Markdown string to ADF node dictionaries.
+
+        Args:
+            markdown: Markdown text to convert
+
+        Returns:
+            A single ADF node dictionary, or a list of node dictionaries
+        """
+        self.parser.reset()
+        return self.parser.parse(markdown)
@@ -3,11 +3,16 @@ ADF node dataclasses for adfmd.
 Provides type-safe internal representation of ADF nodes.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
+# Shared children value for container nodes without content; iterated but
+# never mutated, so every empty container can point at the same tuple.
+_NO_CHILDREN: Sequence["ADFNode"] = ()
 
-@dataclass
+
+@dataclass(slots=True)
 class ADFNode:
     """Base class for all ADF nodes."""
 
@@ -27,70 +32,23 @@ class ADFNode:
         Raises:
             ValueError: If node type is not supported
         """
-        node_type = data.get("type")
-        if node_type == "text":
-            return TextNode.from_dict(data)
-        elif node_type == "paragraph":
-            return ParagraphNode.from_dict(data)
-        elif node_type == "bulletList":
-            return BulletListNode.from_dict(data)
-        elif node_type == "orderedList":
-            return OrderedListNode.from_dict(data)
-        elif node_type == "listItem":
-            return ListItemNode.from_dict(data)
-        elif node_type == "heading":
-            return HeadingNode.from_dict(data)
-        elif node_type == "hardBreak":
-            return HardBreakNode.from_dict(data)
-        elif node_type == "inlineCard":
-            return InlineCardNode.from_dict(data)
-        elif node_type == "rule":
-            return RuleNode.from_dict(data)
-        elif node_type == "date":
-            return DateNode.from_dict(data)
-        elif node_type == "doc":
-            return DocNode.from_dict(data)
-        elif node_type == "status":
-            return StatusNode.from_dict(data)
-        elif node_type == "mention":
-            return MentionNode.from_dict(data)
-        elif node_type == "table":
-            return TableNode.from_dict(data)
-        elif node_type == "tableRow":
-            return TableRowNode.from_dict(data)
-        elif node_type == "tableCell":
-            return TableCellNode.from_dict(data)
-        elif node_type == "tableHeader":
-            return TableHeaderNode.from_dict(data)
-        elif node_type == "extension":
-            return ExtensionNode.from_dict(data)
-        elif node_type == "blockquote":
-            return BlockquoteNode.from_dict(data)
-        elif node_type == "codeBlock":
-            return CodeBlockNode.from_dict(data)
-        elif node_type == "emoji":
-            return EmojiNode.from_dict(data)
-        elif node_type == "panel":
-            return PanelNode.from_dict(data)
-        elif node_type == "mediaSingle":
-            return MediaSingleNode.from_dict(data)
-        elif node_type == "mediaGroup":
-            return MediaGroupNode.from_dict(data)
-        elif node_type == "media":
-            return MediaNode.from_dict(data)
-        elif node_type == "mediaInline":
-            return MediaInlineNode.from_dict(data)
-        elif node_type == "caption":
-            return CaptionNode.from_dict(data)
-        elif node_type == "expand":
-            return ExpandNode.from_dict(data)
-        elif node_type == "nestedExpand":
-            return NestedExpandNode.from_dict(data)
-        else:
-            raise ValueError(f"Unsupported node type: {node_type}")
+        return parse(data)
+
+
+def _build_children(data: Dict[str, Any], _from_dict=ADFNode.from_dict) -> Sequence["ADFNode"]:
+    """Build the child node sequence for a container node.
 
+    The default argument binds ADFNode.from_dict once at definition time,
+    turning the per-child dispatch into a local load. Empty containers
+    share the _NO_CHILDREN tuple instead of allocating a list each.
+    """
+    content = data.get("content")
+    if not content:
+        return _NO_CHILDREN
+    return [_from_dict(item) for item in content]
 
-@dataclass
+
+@dataclass(slots=True)
 class TextNode(ADFNode):
     """Represents a text node in ADF."""
 
@@ -105,35 +63,40 @@ class TextNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TextNode":
         """Create a TextNode from a dictionary."""
-        # Get text marks (excluding link)
-        marks = [mark.get("type") for mark in data.get("marks", []) if mark.get("type") != "link"]
-
-        # Get specific attributes from marks
+        # Single pass over the marks: collect mark names (excluding link)
+        # and pull the attribute-carrying marks out as we go.
+        marks: List[str] = []
         url = None
         subsup = None
         background_color = None
         text_color = None
-        for mark in data.get("marks", []):
-            if mark.get("type") == "link":
-                url = mark.get("attrs", {}).get("href", None)
-            elif mark.get("type") == "subsup":
-                subsup = mark.get("attrs", {}).get("type", None)
-            elif mark.get("type") == "textColor":
-                text_color = mark.get("attrs", {}).get("color", None)
-            elif mark.get("type") == "backgroundColor":
-                background_color = mark.get("attrs", {}).get("color", None)
-
-        return cls(
-            text=data.get("text", ""),
-            marks=marks,
-            url=url,
-            subsup=subsup,
-            background_color=background_color,
-            text_color=text_color,
-        )
-
-
-@dataclass
+        for mark in data.get("marks") or ():
+            mark_type = mark.get("type")
+            if mark_type == "link":
+                url = (mark.get("attrs") or {}).get("href")
+                continue
+            if mark_type == "subsup":
+                subsup = (mark.get("attrs") or {}).get("type")
+            elif mark_type == "textColor":
+                text_color = (mark.get("attrs") or {}).get("color")
+            elif mark_type == "backgroundColor":
+                background_color = (mark.get("attrs") or {}).get("color")
+            marks.append(mark_type)
+
+        # Bypass the dataclass __init__: with slots, direct assignment is
+        # plain stores, and text nodes are by far the most common type.
+        self = object.__new__(cls)
+        self.type = "text"
+        self.text = data.get("text", "")
+        self.marks = marks
+        self.url = url
+        self.subsup = subsup
+        self.background_color = background_color
+        self.text_color = text_color
+        return self
+
+
+@dataclass(slots=True)
 class ParagraphNode(ADFNode):
     """Represents a paragraph node in ADF."""
 
@@ -143,13 +106,13 @@ class ParagraphNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ParagraphNode":
         """Create a ParagraphNode from a dictionary."""
-        children = []
-        for item in data.get("content", []):
-            children.append(ADFNode.from_dict(item))
-        return cls(children=children)
+        self = object.__new__(cls)
+        self.type = "paragraph"
+        self.children = _build_children(data)
+        return self
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockquoteNode(ADFNode):
     """Represents a blockquote node in ADF."""
 
@@ -159,13 +122,11 @@ class BlockquoteNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BlockquoteNode":
         """Create a BlockquoteNode from a dictionary."""
-        children = []
-        for item in data.get("content", []):
-            children.append(ADFNode.from_dict(item))
+        children = _build_children(data)
         return cls(children=children)
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeBlockNode(ADFNode):
     """Represents a codeBlock node in ADF."""
 
@@ -176,23 +137,23 @@ class CodeBlockNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CodeBlockNode":
         """Create a CodeBlockNode from a dictionary."""
-        attrs = data.get("attrs", {})
-        if attrs is None:
-            attrs = {}
+        attrs = data.get("attrs") or {}
 
+        # Documents repeat the same few languages; interning de-duplicates
+        # the strings and makes downstream comparisons identity checks.
         language = attrs.get("language")
+        if language:
+            language = sys.intern(language)
 
         # codeBlock nodes contain one or more plain text nodes without marks
-        text_parts: List[str] = []
-        for item in data.get("content", []):
-            if item.get("type") == "text":
-                text_parts.append(item.get("text", ""))
-        text: str = "\n".join(text_parts)
+        text: str = "\n".join(
+            item.get("text", "") for item in data.get("content") or () if item.get("type") == "text"
+        )
 
         return cls(language=language, text=text)
 
 
-@dataclass
+@dataclass(slots=True)
 class EmojiNode(ADFNode):
     """Represents an emoji node in ADF."""
 
@@ -204,9 +165,7 @@ class EmojiNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "EmojiNode":
         """Create an EmojiNode from a dictionary."""
-        attrs = data.get("attrs", {})
-        if attrs is None:
-            attrs = {}
+        attrs = data.get("attrs") or {}
 
         short_name = attrs.get("shortName")
         id = attrs.get("id")
@@ -215,7 +174,7 @@ class EmojiNode(ADFNode):
         return cls(short_name=short_name, id=id, text=text)
 
 
-@dataclass
+@dataclass(slots=True)
 class PanelNode(ADFNode):
     """Represents a panel node in ADF."""
 
@@ -226,20 +185,16 @@ class PanelNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PanelNode":
         """Create a PanelNode from a dictionary."""
-        attrs = data.get("attrs", {})
-        if attrs is None:
-            attrs = {}
+        attrs = data.get("attrs") or {}
 
         panel_type = attrs.get("panelType")
 
-        children = []
-        for item in data.get("content", []):
-            children.append(ADFNode.from_dict(item))
+        children = _build_children(data)
 
         return cls(panel_type=panel_type, children=children)
 
 
-@dataclass
+@dataclass(slots=True)
 class BulletListNode(ADFNode):
     """Represents a bullet list node in ADF."""
 
@@ -249,13 +204,11 @@ class BulletListNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BulletListNode":
         """Create a BulletListNode from a dictionary, preserving all child nodes."""
-        children = []
-        for item in data.get("content", []):
-            children.append(ADFNode.from_dict(item))
+        children = _build_children(data)
         return cls(children=children)
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderedListNode(ADFNode):
     """Represents an ordered list node in ADF."""
 
@@ -265,13 +218,11 @@ class OrderedListNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "OrderedListNode":
         """Create an OrderedListNode from a dictionary, preserving all child nodes."""
-        children = []
-        for item in data.get("content", []):
-            children.append(ADFNode.from_dict(item))
+        children = _build_children(data)
         return cls(children=children)
 
 
-@dataclass
+@dataclass(slots=True)
 class HeadingNode(ADFNode):
     """Represents a heading node in ADF."""
 
@@ -282,17 +233,15 @@ class HeadingNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "HeadingNode":
         """Create a HeadingNode from a dictionary, preserving all child nodes."""
-        level = data.get("attrs", {}).get("level", None)
+        level = (data.get("attrs") or {}).get("level")
         if level is None:
             raise ValueError("Level is required for heading nodes")
 
-        children = []
-        for item in data.get("content", []):
-            children.append(ADFNode.from_dict(item))
+        children = _build_children(data)
         return cls(level=level, children=children)
 
 
-@dataclass
+@dataclass(slots=True)
 class ListItemNode(ADFNode):
     """Represents a list item node in ADF."""
 
@@ -302,13 +251,11 @@ class ListItemNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ListItemNode":
         """Create a ListItemNode from a dictionary, preserving all child nodes."""
-        children = []
-        for item in data.get("content", []):
-            children.append(ADFNode.from_dict(item))
+        children = _build_children(data)
         return cls(children=children)
 
 
-@dataclass
+@dataclass(slots=True)
 class HardBreakNode(ADFNode):
     """Represents a hard break node in ADF."""
 
@@ -317,10 +264,15 @@ class HardBreakNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "HardBreakNode":
         """Create a HardBreakNode from a dictionary."""
-        return cls()
+        return HARD_BREAK
+
 
+# hardBreak and rule nodes carry no data, so every occurrence shares one
+# instance; from_dict returns these with zero allocation.
+HARD_BREAK = HardBreakNode()
 
-@dataclass
+
+@dataclass(slots=True)
 class InlineCardNode(ADFNode):
     """Represents an inlineCard node in ADF."""
 
@@ -330,19 +282,17 @@ class InlineCardNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "InlineCardNode":
         """Create an InlineCardNode from a dictionary."""
-        attrs = data.get("attrs", {})
-        if attrs is None:
-            attrs = {}
+        attrs = data.get("attrs") or {}
 
         # inlineCard can have url in attrs.url or attrs.data.url
-        url = attrs.get("url") or (attrs.get("data", {}) or {}).get("url", "")
+        url = attrs.get("url") or (attrs.get("data") or {}).get("url", "")
         if not url:
             raise ValueError("URL is required for inlineCard nodes")
 
         return cls(url=url)
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleNode(ADFNode):
     """Represents a rule (horizontal rule) node in ADF."""
 
@@ -351,10 +301,13 @@ class RuleNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RuleNode":
         """Create a RuleNode from a dictionary."""
-        return cls()
+        return RULE
+
 
+RULE = RuleNode()
 
-@dataclass
+
+@dataclass(slots=True)
 class DateNode(ADFNode):
     """Represents a date node in ADF."""
 
@@ -364,19 +317,17 @@ class DateNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DateNode":
         """Create a DateNode from a dictionary."""
-        attrs = data.get("attrs", {})
-        if attrs is None:
-            attrs = {}
+        attrs = data.get("attrs") or {}
 
         # Timestamp is a string of milliseconds since epoch
-        timestamp = data.get("attrs", {}).get("timestamp")
+        timestamp = attrs.get("timestamp")
         if timestamp is None:
             raise ValueError("Timestamp is required for date nodes")
 
         return cls(timestamp=timestamp)
 
 
-@dataclass
+@dataclass(slots=True)
 class DocNode(ADFNode):
     """Represents a doc (document root) node in ADF."""
 
@@ -388,13 +339,11 @@ class DocNode(ADFNode):
     def from_dict(cls, data: Dict[str, Any]) -> "DocNode":
         """Create a DocNode from a dictionary."""
         version = data.get("version")
-        children = []
-        for item in data.get("content", []):
-            children.append(ADFNode.from_dict(item))
+        children = _build_children(data)
         return cls(version=version, children=children)
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusNode(ADFNode):
     """Represents a status node in ADF."""
 
@@ -406,22 +355,17 @@ class StatusNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "StatusNode":
         """Create a StatusNode from a dictionary."""
-        attrs = data.get("attrs", {})
-        if attrs is None:
-            attrs = {}
+        attrs = data.get("attrs") or {}
 
         text = attrs.get("text")
-        if text is None:
-            raise ValueError("Text is required for status nodes")
-
         color = attrs.get("color")
-        if color is None:
-            raise ValueError("Color is required for status nodes")
+        if text is None or color is None:
+            raise ValueError("Text and color are required for status nodes")
 
         return cls(text=text, color=color)
 
 
-@dataclass
+@dataclass(slots=True)
 class MentionNode(ADFNode):
     """Represents a mention node in ADF."""
 
@@ -434,9 +378,7 @@ class MentionNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MentionNode":
         """Create a MentionNode from a dictionary."""
-        attrs = data.get("attrs", {})
-        if attrs is None:
-            attrs = {}
+        attrs = data.get("attrs") or {}
 
         id = attrs.get("id")
         if id is None:
@@ -450,7 +392,7 @@ class MentionNode(ADFNode):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TableNode(ADFNode):
     """Represents a table node in ADF."""
 
@@ -464,13 +406,9 @@ class TableNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TableNode":
         """Create a TableNode from a dictionary, preserving all child nodes."""
-        children = []
-        for item in data.get("content", []):
-            children.append(ADFNode.from_dict(item))
+        children = _build_children(data)
 
-        attrs = data.get("attrs", {})
-        if attrs is None:
-            attrs = {}
+        attrs = data.get("attrs") or {}
 
         return cls(
             children=children,
@@ -481,7 +419,7 @@ class TableNode(ADFNode):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TableRowNode(ADFNode):
     """Represents a table row node in ADF."""
 
@@ -491,13 +429,11 @@ class TableRowNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TableRowNode":
         """Create a TableRowNode from a dictionary, preserving all child nodes."""
-        children = []
-        for item in data.get("content", []):
-            children.append(ADFNode.from_dict(item))
+        children = _build_children(data)
         return cls(children=children)
 
 
-@dataclass
+@dataclass(slots=True)
 class TableCellNode(ADFNode):
     """Represents a table cell node in ADF."""
 
@@ -511,13 +447,9 @@ class TableCellNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TableCellNode":
         """Create a TableCellNode from a dictionary, preserving all child nodes."""
-        children = []
-        for item in data.get("content", []):
-            children.append(ADFNode.from_dict(item))
+        children = _build_children(data)
 
-        attrs = data.get("attrs", {})
-        if attrs is None:
-            attrs = {}
+        attrs = data.get("attrs") or {}
 
         return cls(
             children=children,
@@ -528,7 +460,7 @@ class TableCellNode(ADFNode):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TableHeaderNode(ADFNode):
     """Represents a table header node in ADF."""
 
@@ -542,13 +474,9 @@ class TableHeaderNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TableHeaderNode":
         """Create a TableHeaderNode from a dictionary, preserving all child nodes."""
-        children = []
-        for item in data.get("content", []):
-            children.append(ADFNode.from_dict(item))
+        children = _build_children(data)
 
-        attrs = data.get("attrs", {})
-        if attrs is None:
-            attrs = {}
+        attrs = data.get("attrs") or {}
 
         return cls(
             children=children,
@@ -559,7 +487,7 @@ class TableHeaderNode(ADFNode):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtensionNode(ADFNode):
     """Represents an extension node in ADF."""
 
@@ -572,17 +500,12 @@ class ExtensionNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ExtensionNode":
         """Create an ExtensionNode from a dictionary."""
-        attrs = data.get("attrs", {})
-        if attrs is None:
-            attrs = {}
+        attrs = data.get("attrs") or {}
 
         extension_type = attrs.get("extensionType")
-        if extension_type is None:
-            raise ValueError("extensionType is required for extension nodes")
-
         extension_key = attrs.get("extensionKey")
-        if extension_key is None:
-            raise ValueError("extensionKey is required for extension nodes")
+        if extension_type is None or extension_key is None:
+            raise ValueError("extensionType and extensionKey are required for extension nodes")
 
         return cls(
             extension_type=extension_type,
@@ -592,7 +515,7 @@ class ExtensionNode(ADFNode):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaSingleNode(ADFNode):
     """Represents a mediaSingle node in ADF."""
 
@@ -605,13 +528,9 @@ class MediaSingleNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MediaSingleNode":
         """Create a MediaSingleNode from a dictionary."""
-        attrs = data.get("attrs", {})
-        if attrs is None:
-            attrs = {}
+        attrs = data.get("attrs") or {}
 
-        children = []
-        for item in data.get("content", []):
-            children.append(ADFNode.from_dict(item))
+        children = _build_children(data)
 
         return cls(
             layout=attrs.get("layout"),
@@ -621,7 +540,7 @@ class MediaSingleNode(ADFNode):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaGroupNode(ADFNode):
     """Represents a mediaGroup node in ADF."""
 
@@ -631,13 +550,11 @@ class MediaGroupNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MediaGroupNode":
         """Create a MediaGroupNode from a dictionary."""
-        children = []
-        for item in data.get("content", []):
-            children.append(ADFNode.from_dict(item))
+        children = _build_children(data)
         return cls(children=children)
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaNode(ADFNode):
     """Represents a media node in ADF."""
 
@@ -654,21 +571,13 @@ class MediaNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MediaNode":
         """Create a MediaNode from a dictionary."""
-        attrs = data.get("attrs", {})
-        if attrs is None:
-            attrs = {}
+        attrs = data.get("attrs") or {}
 
         id = attrs.get("id")
-        if id is None:
-            raise ValueError("ID is required for media nodes")
-
         collection = attrs.get("collection")
-        if collection is None:
-            raise ValueError("Collection is required for media nodes")
-
         media_type = attrs.get("type")
-        if media_type is None:
-            raise ValueError("Type is required for media nodes")
+        if id is None or collection is None or media_type is None:
+            raise ValueError("ID, collection and type are required for media nodes")
 
         border_size = None
         border_color = None
@@ -690,7 +599,7 @@ class MediaNode(ADFNode):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaInlineNode(ADFNode):
     """Represents a mediaInline node in ADF."""
 
@@ -707,21 +616,13 @@ class MediaInlineNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MediaInlineNode":
         """Create a MediaInlineNode from a dictionary."""
-        attrs = data.get("attrs", {})
-        if attrs is None:
-            attrs = {}
+        attrs = data.get("attrs") or {}
 
         id = attrs.get("id")
-        if id is None:
-            raise ValueError("ID is required for mediaInline nodes")
-
         collection = attrs.get("collection")
-        if collection is None:
-            raise ValueError("Collection is required for mediaInline nodes")
-
         media_type = attrs.get("type")
-        if media_type is None:
-            raise ValueError("Type is required for mediaInline nodes")
+        if id is None or collection is None or media_type is None:
+            raise ValueError("ID, collection and type are required for mediaInline nodes")
 
         border_size = None
         border_color = None
@@ -743,7 +644,7 @@ class MediaInlineNode(ADFNode):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CaptionNode(ADFNode):
     """Represents a caption node in ADF."""
 
@@ -753,13 +654,11 @@ class CaptionNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CaptionNode":
         """Create a CaptionNode from a dictionary."""
-        children = []
-        for item in data.get("content", []):
-            children.append(ADFNode.from_dict(item))
+        children = _build_children(data)
         return cls(children=children)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExpandNode(ADFNode):
     """Represents an expand node in ADF."""
 
@@ -770,20 +669,16 @@ class ExpandNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ExpandNode":
         """Create an ExpandNode from a dictionary."""
-        attrs = data.get("attrs", {})
-        if attrs is None:
-            attrs = {}
+        attrs = data.get("attrs") or {}
 
         title = attrs.get("title")
 
-        children = []
-        for item in data.get("content", []):
-            children.append(ADFNode.from_dict(item))
+        children = _build_children(data)
 
         return cls(title=title, children=children)
 
 
-@dataclass
+@dataclass(slots=True)
 class NestedExpandNode(ADFNode):
     """Represents a nestedExpand node in ADF."""
 
@@ -794,14 +689,113 @@ class NestedExpandNode(ADFNode):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "NestedExpandNode":
         """Create a NestedExpandNode from a dictionary."""
-        attrs = data.get("attrs", {})
-        if attrs is None:
-            attrs = {}
+        attrs = data.get("attrs") or {}
 
         title = attrs.get("title")
 
-        children = []
-        for item in data.get("content", []):
-            children.append(ADFNode.from_dict(item))
+        children = _build_children(data)
 
         return cls(title=title, children=children)
+
+
+# Node type dispatch table for ADFNode.from_dict: one hash lookup per node
+# instead of an if/elif chain over every supported type.
+_NODE_DISPATCH = {
+    "text": TextNode.from_dict,
+    "paragraph": ParagraphNode.from_dict,
+    "bulletList": BulletListNode.from_dict,
+    "orderedList": OrderedListNode.from_dict,
+    "listItem": ListItemNode.from_dict,
+    "heading": HeadingNode.from_dict,
+    "hardBreak": HardBreakNode.from_dict,
+    "inlineCard": InlineCardNode.from_dict,
+    "rule": RuleNode.from_dict,
+    "date": DateNode.from_dict,
+    "doc": DocNode.from_dict,
+    "status": StatusNode.from_dict,
+    "mention": MentionNode.from_dict,
+    "table": TableNode.from_dict,
+    "tableRow": TableRowNode.from_dict,
+    "tableCell": TableCellNode.from_dict,
+    "tableHeader": TableHeaderNode.from_dict,
+    "extension": ExtensionNode.from_dict,
+    "blockquote": BlockquoteNode.from_dict,
+    "codeBlock": CodeBlockNode.from_dict,
+    "emoji": EmojiNode.from_dict,
+    "panel": PanelNode.from_dict,
+    "mediaSingle": MediaSingleNode.from_dict,
+    "mediaGroup": MediaGroupNode.from_dict,
+    "media": MediaNode.from_dict,
+    "mediaInline": MediaInlineNode.from_dict,
+    "caption": CaptionNode.from_dict,
+    "expand": ExpandNode.from_dict,
+    "nestedExpand": NestedExpandNode.from_dict,
+}
+
+# Node types whose from_dict builds a children list from "content"; the
+# iterative parse() descends into these itself.
+_CONTAINER_TYPES = frozenset(
+    {
+        "paragraph",
+        "blockquote",
+        "panel",
+        "bulletList",
+        "orderedList",
+        "heading",
+        "listItem",
+        "doc",
+        "table",
+        "tableRow",
+        "tableCell",
+        "tableHeader",
+        "mediaSingle",
+        "mediaGroup",
+        "caption",
+        "expand",
+        "nestedExpand",
+    }
+)
+
+
+def _dispatch(data: Dict[str, Any]) -> ADFNode:
+    """Build a single node (without descending into content) via the type table."""
+    try:
+        return _NODE_DISPATCH[data["type"]](data)
+    except KeyError:
+        raise ValueError(f"Unsupported node type: {data.get('type')}") from None
+
+
+def parse(data: Dict[str, Any]) -> ADFNode:
+    """
+    Build an ADF node tree iteratively with an explicit work stack.
+
+    Container nodes are constructed from their dictionary minus "content",
+    and their children are pushed onto the stack with a reference to the
+    parent's children list. This avoids one interpreter frame per node and
+    keeps arbitrarily deep documents clear of the recursion limit.
+
+    Args:
+        data: Dictionary containing node data
+
+    Returns:
+        Appropriate ADF node instance
+
+    Raises:
+        ValueError: If a node type is not supported
+    """
+    root: List[ADFNode] = []
+    stack: List[Any] = [(data, root)]
+    while stack:
+        node_data, out = stack.pop()
+        content = node_data.get("content")
+        if content and node_data.get("type") in _CONTAINER_TYPES:
+            shallow = dict(node_data)
+            del shallow["content"]
+            node = _dispatch(shallow)
+            children: List[ADFNode] = []
+            node.children = children
+            stack.extend((item, children) for item in reversed(content))
+        else:
+            node = _dispatch(node_data)
+        out.append(node)
+    return root[0]
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for the adfmd test suite.
+
+Session-scoped so that each worker (when the suite runs under
+pytest-xdist) builds its corpus and converter exactly once.
+"""
+
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add parent directory to path to import adfmd
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from adfmd import ADFMD
+
+try:  # Optional speedup for decoding fixture documents.
+    import orjson
+
+    def _loads(text):
+        return orjson.loads(text)
+
+except ImportError:
+    _loads = json.loads
+
+
+@pytest.fixture(scope="session")
+def adf_corpus():
+    """Load every fixture pair once per session: path, parsed ADF, markdown.
+
+    File reads are prefetched concurrently — reading releases the GIL, so
+    a thread pool overlaps the open/read latency on cold caches — and the
+    bytes are decoded in the collecting thread.
+    """
+    test_dir = Path(__file__).parent / "data"
+    pairs = [
+        (json_path, json_path.with_suffix(".md"))
+        for json_path in sorted(test_dir.glob("*.json"))
+        if json_path.with_suffix(".md").exists()
+    ]
+    paths = [path for pair in pairs for path in pair]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        raw = dict(zip(paths, executor.map(Path.read_bytes, paths)))
+    return {
+        json_path.stem: {
+            "json_path": json_path,
+            "adf": _loads(raw[json_path]),
+            "md": raw[md_path].decode("utf-8"),
+        }
+        for json_path, md_path in pairs
+    }
+
+
+@pytest.fixture(scope="session")
+def converter():
+    """Share one ADFMD converter across all cases; convert calls are stateless."""
+    return ADFMD()
+
+
+@pytest.fixture(scope="session")
+def to_markdown_cached(converter, adf_corpus):
+    """Memoize file-based ADF-to-Markdown conversions by test name."""
+    cache = {}
+
+    def convert(test_name):
+        result = cache.get(test_name)
+        if result is None:
+            result = converter.to_markdown_file(adf_corpus[test_name]["json_path"])
+            cache[test_name] = result
+        return result
+
+    return convert